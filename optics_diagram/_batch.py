@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+import numpy as np
+from matplotlib import colors as mcolors
+
+
+def add_patch(ax: Any, patch: Any) -> None:
+    """Register a patch on the axes, batching it if a collector is open.
+
+    Inside a `collect` block the patch is queued on `ax._optics_batch`
+    and later emitted as part of one collection per layer; outside it
+    behaves exactly like `ax.add_patch`.
+    """
+    batch = getattr(ax, "_optics_batch", None)
+    if batch is not None:
+        batch[0].append(patch)
+    else:
+        ax.add_patch(patch)
+
+
+def add_line(ax: Any, line: Any) -> None:
+    """Register a line on the axes, batching it if a collector is open."""
+    batch = getattr(ax, "_optics_batch", None)
+    if batch is not None:
+        batch[1].append(line)
+    else:
+        ax.add_line(line)
+
+
+@contextmanager
+def collect(ax: Any) -> Iterator[None]:
+    """Collect patches and lines emitted by draw() calls into collections.
+
+    Component draws funnel their artists through `add_patch`/`add_line`;
+    on exit the queued patches become one PathCollection per
+    (zorder, joinstyle) layer and the queued lines one LineCollection per
+    zorder, so per-artist axes registration (and its limit bookkeeping)
+    is paid once per layer instead of once per artist.
+    """
+    ax._optics_batch = ([], [])
+    try:
+        yield
+    finally:
+        patches, lines = ax._optics_batch
+        del ax._optics_batch
+        _flush_patches(ax, patches)
+        _flush_lines(ax, lines)
+
+
+def _data_transform(ax: Any, artist: Any) -> Any:
+    """Return the artist's transform with the data->display stage removed.
+
+    Component artists carry either no artist transform (their geometry
+    is already in data coordinates) or `rotation + ax.transData`; in the
+    latter case the trailing transData branch is stripped so the path
+    can live in a collection drawn with `ax.transData`.
+    """
+    tr = artist.get_transform()
+    if tr.contains_branch(ax.transData):
+        tr = tr - ax.transData
+    return tr
+
+
+def _flush_patches(ax: Any, batch: list[Any]) -> None:
+    from matplotlib.collections import PathCollection
+
+    groups: dict[tuple[Any, ...], list[Any]] = {}
+    for patch in batch:
+        key = (patch.get_zorder(), patch.get_joinstyle())
+        groups.setdefault(key, []).append(patch)
+    for (zorder, joinstyle), group in groups.items():
+        paths = [
+            _data_transform(ax, p).transform_path(p.get_path()) for p in group
+        ]
+        collection = PathCollection(
+            paths,
+            facecolors=[mcolors.to_rgba(p.get_facecolor(), p.get_alpha()) for p in group],
+            edgecolors=[mcolors.to_rgba(p.get_edgecolor(), p.get_alpha()) for p in group],
+            linewidths=[p.get_linewidth() for p in group],
+            zorder=zorder,
+        )
+        collection.set_joinstyle(joinstyle)
+        collection.set_transform(ax.transData)
+        ax.add_collection(collection)
+
+
+def _flush_lines(ax: Any, batch: list[Any]) -> None:
+    from matplotlib.collections import LineCollection
+
+    groups: dict[float, list[Any]] = {}
+    for line in batch:
+        groups.setdefault(line.get_zorder(), []).append(line)
+    for zorder, group in groups.items():
+        segments = [
+            _data_transform(ax, ln).transform(np.column_stack(ln.get_data()))
+            for ln in group
+        ]
+        collection = LineCollection(
+            segments,
+            colors=[ln.get_color() for ln in group],
+            linewidths=[ln.get_linewidth() for ln in group],
+            zorder=zorder,
+        )
+        collection.set_transform(ax.transData)
+        ax.add_collection(collection)
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Sequence, Tuple
+
+import numpy as np
+
+try:  # Numba is optional; the fillet compiles to one fused kernel if present
+    from numba import njit
+except ImportError:  # pragma: no cover
+    njit = None
+
+Point = Tuple[float, float]
+
+
+@lru_cache(maxsize=16)
+def _bezier_basis(samples: int) -> np.ndarray:
+    """Quadratic Bezier basis for the interior arc samples, cached by count."""
+    t = np.linspace(0.0, 1.0, samples, endpoint=False)[1:, None]
+    return np.hstack([(1 - t) ** 2, 2 * (1 - t) * t, t**2])
+
+
+def _fillet_polyline_fused(
+    pts: np.ndarray, radius: float, samples: int, basis: np.ndarray
+) -> np.ndarray:
+    # Scalar single-pass variant writing straight into a preallocated
+    # buffer sized for the worst case; no intermediate arrays at all.
+    # Mirrors the vectorized path below exactly.
+    n = pts.shape[0]
+    out = np.empty((2 + (n - 2) * (samples + 1), 2))
+    out[0, 0] = pts[0, 0]
+    out[0, 1] = pts[0, 1]
+    pos = 1
+    prev_tx, prev_ty = pts[0, 0], pts[0, 1]
+    for i in range(1, n - 1):
+        cx, cy = pts[i, 0], pts[i, 1]
+        in_x, in_y = cx - pts[i - 1, 0], cy - pts[i - 1, 1]
+        out_x, out_y = pts[i + 1, 0] - cx, pts[i + 1, 1] - cy
+        len_in = (in_x * in_x + in_y * in_y) ** 0.5
+        len_out = (out_x * out_x + out_y * out_y) ** 0.5
+        if len_in == 0.0 or len_out == 0.0:
+            out[pos, 0] = cx
+            out[pos, 1] = cy
+            pos += 1
+            prev_tx, prev_ty = cx, cy
+            continue
+        cut = min(radius, 0.5 * min(len_in, len_out))
+        a_x, a_y = cx - in_x / len_in * cut, cy - in_y / len_in * cut
+        b_x, b_y = cx + out_x / len_out * cut, cy + out_y / len_out * cut
+        dx, dy = a_x - prev_tx, a_y - prev_ty
+        if (dx * dx + dy * dy) ** 0.5 > 1e-9:
+            out[pos, 0] = a_x
+            out[pos, 1] = a_y
+            pos += 1
+        for k in range(samples - 1):
+            w0, w1, w2 = basis[k, 0], basis[k, 1], basis[k, 2]
+            out[pos, 0] = w0 * a_x + w1 * cx + w2 * b_x
+            out[pos, 1] = w0 * a_y + w1 * cy + w2 * b_y
+            pos += 1
+        out[pos, 0] = b_x
+        out[pos, 1] = b_y
+        pos += 1
+        prev_tx, prev_ty = b_x, b_y
+    out[pos, 0] = pts[n - 1, 0]
+    out[pos, 1] = pts[n - 1, 1]
+    pos += 1
+    return out[:pos]
+
+
+if njit is not None:
+    _fillet_polyline_fused = njit(cache=True)(_fillet_polyline_fused)
+
+
+def _fillet_polyline(
+    points: Sequence[Point], radius: float = 0.15, samples: int = 6
+) -> np.ndarray:
+    """Return a polyline with rounded corners using quadratic Bezier fillets."""
+    if len(points) < 3:
+        return np.asarray(points, dtype=float)
+    pts = np.asarray(points, dtype=float)
+    basis = _bezier_basis(samples)
+    if njit is not None:
+        return _fillet_polyline_fused(pts, radius, samples, basis)
+
+    # One pass over the whole polyline: segment vectors, lengths, and unit
+    # directions for every corner at once instead of per-corner norm calls
+    v = np.diff(pts, axis=0)
+    lens = np.hypot(v[:, 0], v[:, 1])
+    u = np.where(lens[:, None] > 0, v / np.where(lens == 0, 1.0, lens)[:, None], 0.0)
+    len_in, len_out = lens[:-1], lens[1:]
+    ok = (len_in > 0) & (len_out > 0)
+    cut = np.minimum(radius, 0.5 * np.minimum(len_in, len_out))[:, None]
+    corners = pts[1:-1]
+    a_pts = np.where(ok[:, None], corners - u[:-1] * cut, corners)
+    b_pts = np.where(ok[:, None], corners + u[1:] * cut, corners)
+
+    # All interior arc samples in one (corners, samples-1, 2) matmul
+    arcs = basis @ np.stack([a_pts, corners, b_pts], axis=1)
+
+    # Corner i is entered from the previous corner's exit point (or the
+    # start); its a-point is dropped when it duplicates that point
+    prev_tail = np.concatenate([pts[:1], b_pts[:-1]])
+    keep_a = ok & (np.hypot(*(a_pts - prev_tail).T) > 1e-9)
+
+    # Assemble into a preallocated buffer; degenerate corners (a
+    # zero-length neighbouring segment) pass through as a single point
+    counts = np.where(ok, samples + keep_a, 1)
+    out = np.empty((1 + int(counts.sum()) + 1, 2), dtype=float)
+    out[0] = pts[0]
+    out[-1] = pts[-1]
+    pos = 1
+    for i in range(len(corners)):
+        if not ok[i]:
+            out[pos] = corners[i]
+            pos += 1
+            continue
+        if keep_a[i]:
+            out[pos] = a_pts[i]
+            pos += 1
+        out[pos : pos + samples - 1] = arcs[i]
+        out[pos + samples - 1] = b_pts[i]
+        pos += samples
+    return out
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any
+
+import numpy as np
+
+
+@lru_cache(maxsize=32)
+def _vgradient(rows: int, cols: int) -> np.ndarray:
+    """Return a cached (rows, cols) ramp running 0 -> 1 down the rows.
+
+    The result is a read-only float32 broadcast view, so repeat draws at
+    the same raster shape share one linspace instead of re-tiling per
+    call. imshow casts to float32 internally anyway, and it copies, so
+    handing out the same view is safe.
+    """
+    g = np.linspace(0.0, 1.0, rows, dtype=np.float32)[:, None]
+    return np.broadcast_to(g, (rows, cols))
+
+
+@lru_cache(maxsize=32)
+def _hgradient(rows: int, cols: int) -> np.ndarray:
+    """Return a cached (rows, cols) ramp running 0 -> 1 across the columns."""
+    g = np.linspace(0.0, 1.0, cols, dtype=np.float32)[None, :]
+    return np.broadcast_to(g, (rows, cols))
+
+
+@lru_cache(maxsize=8)
+def _diag_gradient(rows: int, cols: int) -> np.ndarray:
+    """Return a cached (rows, cols) top-left -> bottom-right diagonal ramp."""
+    gx = np.linspace(0.0, 1.0, cols, dtype=np.float32)
+    gy = np.linspace(0.0, 1.0, rows, dtype=np.float32)
+    # Broadcast the two 1-D ramps directly instead of materializing the
+    # meshgrid pair; only the result itself is allocated
+    diag = (gx[None, :] + (1.0 - gy[:, None])) * 0.5
+    diag.flags.writeable = False
+    return diag
+
+
+# Colormap objects are unhashable, so the RGBA cache keys on the cmap
+# name; component palettes are module singletons with distinct names
+_CMAPS: dict[str, Any] = {}
+
+
+def _rgba_fill(cmap: Any, rows: int, cols: int, orientation: str = "h") -> np.ndarray:
+    """Return a cached uint8 RGBA raster of `cmap` applied to a ramp.
+
+    `orientation` selects the ramp: "h" across columns, "v" down rows,
+    "diag" top-left to bottom-right. Passing uint8 RGBA to imshow hits
+    Agg's fast path — no colormap lookup or float conversion at render
+    time — and the buffer is shared by every component with the same
+    colormap and shape.
+    """
+    _CMAPS.setdefault(cmap.name, cmap)
+    return _rgba_fill_cached(cmap.name, rows, cols, orientation)
+
+
+@lru_cache(maxsize=32)
+def _rgba_fill_cached(
+    cmap_name: str, rows: int, cols: int, orientation: str
+) -> np.ndarray:
+    cmap = _CMAPS[cmap_name]
+    if orientation == "v":
+        gradient = _vgradient(rows, cols)
+    elif orientation == "diag":
+        gradient = _diag_gradient(rows, cols)
+    else:
+        gradient = _hgradient(rows, cols)
+    return cmap(gradient, bytes=True)
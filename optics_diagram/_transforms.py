@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from math import cos, radians, sin
+
+import numpy as np
+from matplotlib.transforms import Affine2D
+
+
+@lru_cache(maxsize=64)
+def cos_sin_deg(angle_deg: float) -> tuple[float, float]:
+    """Return cached (cos, sin) of an angle given in degrees.
+
+    Contact-point helpers call this instead of re-evaluating trig for
+    every query against the same component orientation.
+    """
+    a = radians(angle_deg)
+    return cos(a), sin(a)
+
+
+@lru_cache(maxsize=512)
+def rotation_around(cx: float, cy: float, angle_deg: float) -> Affine2D:
+    """Return a cached rotation of `angle_deg` degrees about (cx, cy).
+
+    Component `draw` methods compose the result with `ax.transData` each
+    call; the trig evaluation and matrix construction happen once per
+    distinct (cx, cy, angle_deg). Callers must treat the returned
+    transform as read-only.
+    """
+    return Affine2D().rotate_deg_around(cx, cy, angle_deg)
+
+
+def rotate_points(
+    local_xy: "np.ndarray | list[tuple[float, float]]",
+    angle_deg: float,
+    center: tuple[float, float] = (0.0, 0.0),
+) -> np.ndarray:
+    """Rotate an (N, 2) array of local offsets and shift by `center`.
+
+    Components with several anchor points rotate them all with one
+    matmul instead of per-point scalar trig.
+    """
+    ca, sa = cos_sin_deg(angle_deg)
+    rot = np.array([[ca, sa], [-sa, ca]])
+    return np.asarray(local_xy, dtype=float) @ rot + center
@@ -14,8 +14,6 @@ class Annotation:
     color: str | Tuple[float, float, float] = "black"
 
     def draw(self, ax: Any) -> None:
-        import matplotlib.pyplot as plt  # deferred import
-
         if self.arrow and self.xytext is not None:
             ax.annotate(
                 self.text,
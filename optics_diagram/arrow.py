@@ -13,8 +13,6 @@ class Arrow:
     style: str = "->"
 
     def draw(self, ax: Any) -> None:
-        import matplotlib.pyplot as plt  # deferred import
-
         ax.annotate(
             "",
             xy=self.end,
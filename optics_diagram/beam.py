@@ -3,32 +3,83 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any, List, Sequence, Tuple, Optional
 
+import numpy as np
+from matplotlib.collections import LineCollection
 
-def wavelength_to_rgb(wavelength_nm: float) -> Tuple[float, float, float]:
-    """Approximate conversion from wavelength in nm to an RGB tuple (0-1).
+try:  # Numba is optional; the scalar color path compiles to native code if present
+    from numba import njit
+except ImportError:  # pragma: no cover
+    njit = None
+
+
+def wavelengths_to_rgb(wavelengths_nm: Any) -> np.ndarray:
+    """Convert an array of wavelengths in nm to an (N, 3) RGB array (0-1).
 
     Range clamped to ~380-780 nm.
-    Implementation adapted from common public-domain approximations.
+    Implementation adapted from common public-domain approximations; the
+    band arithmetic runs as vectorized NumPy ufuncs so batched conversions
+    avoid per-wavelength Python overhead.
     """
-    w = max(380.0, min(780.0, float(wavelength_nm)))
+    w = np.clip(np.asarray(wavelengths_nm, dtype=np.float64), 380.0, 780.0)
+
+    bands = [
+        (380.0 <= w) & (w < 440.0),
+        (440.0 <= w) & (w < 490.0),
+        (490.0 <= w) & (w < 510.0),
+        (510.0 <= w) & (w < 580.0),
+        (580.0 <= w) & (w < 645.0),
+    ]
+    r = np.select(
+        bands,
+        [-(w - 440.0) / (440.0 - 380.0), 0.0, 0.0, (w - 510.0) / (580.0 - 510.0), 1.0],
+        default=1.0,
+    )
+    g = np.select(
+        bands,
+        [0.0, (w - 440.0) / (490.0 - 440.0), 1.0, 1.0, -(w - 645.0) / (645.0 - 580.0)],
+        default=0.0,
+    )
+    b = np.select(
+        bands,
+        [1.0, 1.0, -(w - 510.0) / (510.0 - 490.0), 0.0, 0.0],
+        default=0.0,
+    )
+
+    # Intensity adjustment near vision limits
+    factor = np.select(
+        [w < 420.0, w < 700.0],
+        [0.3 + 0.7 * (w - 380.0) / (420.0 - 380.0), 1.0],
+        default=0.3 + 0.7 * (780.0 - w) / (780.0 - 700.0),
+    )
+
+    return np.clip(np.stack([r, g, b], axis=-1) * factor[..., None], 0.0, 1.0)
+
 
-    if 380.0 <= w < 440.0:
+def _wavelength_to_rgb_scalar(w: float) -> Tuple[float, float, float]:
+    # Plain-float branch ladder mirroring wavelengths_to_rgb; kept free of
+    # NumPy so Numba can compile it when available.
+    if w < 380.0:
+        w = 380.0
+    elif w > 780.0:
+        w = 780.0
+
+    if w < 440.0:
         r, g, b = -(w - 440.0) / (440.0 - 380.0), 0.0, 1.0
-    elif 440.0 <= w < 490.0:
+    elif w < 490.0:
         r, g, b = 0.0, (w - 440.0) / (490.0 - 440.0), 1.0
-    elif 490.0 <= w < 510.0:
+    elif w < 510.0:
         r, g, b = 0.0, 1.0, -(w - 510.0) / (510.0 - 490.0)
-    elif 510.0 <= w < 580.0:
+    elif w < 580.0:
         r, g, b = (w - 510.0) / (580.0 - 510.0), 1.0, 0.0
-    elif 580.0 <= w < 645.0:
+    elif w < 645.0:
         r, g, b = 1.0, -(w - 645.0) / (645.0 - 580.0), 0.0
     else:
         r, g, b = 1.0, 0.0, 0.0
 
     # Intensity adjustment near vision limits
-    if 380.0 <= w < 420.0:
+    if w < 420.0:
         factor = 0.3 + 0.7 * (w - 380.0) / (420.0 - 380.0)
-    elif 420.0 <= w < 700.0:
+    elif w < 700.0:
         factor = 1.0
     else:
         factor = 0.3 + 0.7 * (780.0 - w) / (780.0 - 700.0)
@@ -40,15 +91,133 @@ def wavelength_to_rgb(wavelength_nm: float) -> Tuple[float, float, float]:
     )
 
 
+if njit is not None:
+    _wavelength_to_rgb_scalar = njit(cache=True)(_wavelength_to_rgb_scalar)
+
+
+def wavelength_to_rgb(wavelength_nm: float) -> Tuple[float, float, float]:
+    """Scalar counterpart of `wavelengths_to_rgb` for single conversions."""
+    return _wavelength_to_rgb_scalar(float(wavelength_nm))
+
+
 Point = Tuple[float, float]
 
 
-@dataclass
+class _BeamGraph:
+    """Shared structure-of-arrays storage behind one or more `Beam` views.
+
+    Node coordinates live in parallel float64 columns (plus per-node parent
+    and child counts) so `Beam.draw` can hand contiguous arrays straight to
+    Matplotlib without touching Python objects per node. Branches created via
+    `Beam.divide` alias the same instance.
+    """
+
+    __slots__ = (
+        "xs",
+        "ys",
+        "parent_count",
+        "child_count",
+        "n_nodes",
+        "edges_buf",
+        "n_edges",
+        "roots",
+        "leaves",
+        "first_parent",
+    )
+
+    _INITIAL_CAPACITY = 16
+
+    def __init__(self) -> None:
+        cap = self._INITIAL_CAPACITY
+        self.xs = np.zeros(cap, dtype=np.float64)
+        self.ys = np.zeros(cap, dtype=np.float64)
+        self.parent_count = np.zeros(cap, dtype=np.int32)
+        self.child_count = np.zeros(cap, dtype=np.int32)
+        self.n_nodes = 0
+        self.edges_buf = np.zeros((cap, 2), dtype=np.int32)
+        self.n_edges = 0
+        self.roots: List[int] = []
+        # Leaf bookkeeping kept incrementally so draw never rescans nodes
+        self.leaves: set[int] = set()
+        self.first_parent = np.full(cap, -1, dtype=np.int32)
+
+    @staticmethod
+    def _grow(arr: np.ndarray, fill: float = 0) -> np.ndarray:
+        grown = np.full((2 * len(arr), *arr.shape[1:]), fill, dtype=arr.dtype)
+        grown[: len(arr)] = arr
+        return grown
+
+    def add_node(self, x: float, y: float) -> int:
+        i = self.n_nodes
+        if i == len(self.xs):
+            self.xs = self._grow(self.xs)
+            self.ys = self._grow(self.ys)
+            self.parent_count = self._grow(self.parent_count)
+            self.child_count = self._grow(self.child_count)
+            self.first_parent = self._grow(self.first_parent, fill=-1)
+        self.xs[i] = x
+        self.ys[i] = y
+        self.n_nodes = i + 1
+        return i
+
+    def add_edge(self, parent: int, child: int) -> None:
+        i = self.n_edges
+        if i == len(self.edges_buf):
+            self.edges_buf = self._grow(self.edges_buf)
+        self.edges_buf[i, 0] = parent
+        self.edges_buf[i, 1] = child
+        self.n_edges = i + 1
+        self.child_count[parent] += 1
+        self.parent_count[child] += 1
+        if self.first_parent[child] < 0:
+            self.first_parent[child] = parent
+        # The parent stops being a leaf; the child becomes one unless it
+        # already has children of its own (edges may arrive in any order)
+        self.leaves.discard(parent)
+        if self.child_count[child] == 0:
+            self.leaves.add(child)
+
+    @property
+    def edges(self) -> np.ndarray:
+        """View of the populated (n_edges, 2) slice of the edge buffer."""
+        return self.edges_buf[: self.n_edges]
+
+
 class BeamPoint:
-    x: float
-    y: float
-    parents: List["BeamPoint"] = field(default_factory=list)
-    children: List["BeamPoint"] = field(default_factory=list)
+    """Lightweight view of a single node in a beam graph.
+
+    Holds only a reference to the shared `_BeamGraph` and the node index;
+    coordinates are read from the graph's coordinate columns on access.
+    """
+
+    __slots__ = ("_graph", "index")
+
+    def __init__(self, graph: _BeamGraph, index: int) -> None:
+        self._graph = graph
+        self.index = index
+
+    def __repr__(self) -> str:
+        return f"BeamPoint(x={self.x}, y={self.y})"
+
+    @property
+    def x(self) -> float:
+        return float(self._graph.xs[self.index])
+
+    @property
+    def y(self) -> float:
+        return float(self._graph.ys[self.index])
+
+    @property
+    def parents(self) -> List["BeamPoint"]:
+        g = self._graph
+        edges = g.edges
+        return [BeamPoint(g, int(p)) for p in edges[edges[:, 1] == self.index, 0]]
+
+    @property
+    def children(self) -> List["BeamPoint"]:
+        g = self._graph
+        edges = g.edges
+        return [BeamPoint(g, int(c)) for c in edges[edges[:, 0] == self.index, 1]]
 
     def divide(self, other: "BeamPoint", m: float, n: float) -> "BeamPoint":
         """Return the section point dividing self→other in the ratio m:n.
@@ -57,13 +226,16 @@ class BeamPoint:
         positive. If one of m or n is negative, it yields an external division
         point (outside the segment) on the corresponding side, e.g.
         self.divide(other, -1, 2) is outside near `self`.
+
+        The point is stored in the shared graph but stays disconnected, so it
+        never renders as a segment or an arrow leaf.
         """
         denom = m + n
         if abs(denom) < 1e-12:
             raise ValueError("Undefined division: m + n must not be zero")
         x = (n * self.x + m * other.x) / denom
         y = (n * self.y + m * other.y) / denom
-        return BeamPoint(x, y)
+        return BeamPoint(self._graph, self._graph.add_node(x, y))
 
 
 @dataclass
@@ -83,26 +255,18 @@ class Beam:
     zorder: float = 100.0
 
     # Graph storage (shared between branches)
-    _nodes: List[BeamPoint] = field(default_factory=list, init=False, repr=False)
-    _edges: List[Tuple[BeamPoint, BeamPoint]] = field(
-        default_factory=list, init=False, repr=False
-    )
-    _roots: List[BeamPoint] = field(default_factory=list, init=False, repr=False)
+    _graph: _BeamGraph = field(default_factory=_BeamGraph, init=False, repr=False)
     _current: Optional[BeamPoint] = field(default=None, init=False, repr=False)
 
     def _add_node(self, x: float, y: float) -> BeamPoint:
-        node = BeamPoint(x, y)
-        self._nodes.append(node)
-        return node
+        return BeamPoint(self._graph, self._graph.add_node(x, y))
 
     def _add_edge(self, a: BeamPoint, b: BeamPoint) -> None:
-        a.children.append(b)
-        b.parents.append(a)
-        self._edges.append((a, b))
+        self._graph.add_edge(a.index, b.index)
 
     def move_to(self, x: float, y: float) -> BeamPoint:
         start = self._add_node(x, y)
-        self._roots.append(start)
+        self._graph.roots.append(start.index)
         self._current = start
         return start
 
@@ -152,9 +316,7 @@ class Beam:
             show_arrow=self.show_arrow,
         )
         # Share the storage by reference
-        branch._nodes = self._nodes
-        branch._edges = self._edges
-        branch._roots = self._roots
+        branch._graph = self._graph
         branch._current = at
         return branch
 
@@ -166,29 +328,51 @@ class Beam:
         )
 
     def draw(self, ax: Any) -> None:
-        if not self._edges:
+        g = self._graph
+        if g.n_edges == 0:
             return
         c = self._color()
-        # Draw all segments
-        for a, b in self._edges:
-            ax.plot(
-                [a.x, b.x],
-                [a.y, b.y],
-                color=c,
-                lw=self.linewidth,
+        edges = g.edges
+        xs = g.xs[: g.n_nodes]
+        ys = g.ys[: g.n_nodes]
+        # Batch all segments into a single LineCollection instead of one
+        # Line2D per edge; the coordinate columns index straight into the
+        # (E, 2, 2) segments array with no per-node Python work.
+        segments = np.stack([xs[edges], ys[edges]], axis=-1)
+        ax.add_collection(
+            LineCollection(
+                segments,
+                colors=[c],
+                linewidths=self.linewidth,
                 zorder=self.zorder,
             )
-        # Draw arrows at leaves
-        if self.show_arrow:
-            leaves = [
-                n for n in self._nodes if len(n.children) == 0 and len(n.parents) > 0
-            ]
-            for leaf in leaves:
-                for parent in leaf.parents:
-                    ax.annotate(
-                        "",
-                        xy=(leaf.x, leaf.y),
-                        xytext=(parent.x, parent.y),
-                        arrowprops=dict(arrowstyle="->", color=c, lw=self.linewidth),
-                        zorder=self.zorder,
-                    )
+        )
+        # Draw arrows at the maintained leaf set. One quiver call covers
+        # every leaf; ax.annotate parses its arrowprops dict per arrow and
+        # is the heaviest arrow API.
+        if self.show_arrow and g.leaves:
+            leaves = np.fromiter(g.leaves, dtype=np.int32, count=len(g.leaves))
+            # Common case: a single stored first parent per leaf; leaves
+            # with several parents fall back to an edge scan for the rest
+            single = leaves[g.parent_count[leaves] == 1]
+            leaf_edges = np.stack([g.first_parent[single], single], axis=1)
+            multi = leaves[g.parent_count[leaves] > 1]
+            if len(multi):
+                leaf_edges = np.concatenate(
+                    [leaf_edges, edges[np.isin(edges[:, 1], multi)]]
+                )
+            if len(leaf_edges):
+                tails_x = xs[leaf_edges[:, 0]]
+                tails_y = ys[leaf_edges[:, 0]]
+                ax.quiver(
+                    tails_x,
+                    tails_y,
+                    xs[leaf_edges[:, 1]] - tails_x,
+                    ys[leaf_edges[:, 1]] - tails_y,
+                    angles="xy",
+                    scale_units="xy",
+                    scale=1.0,
+                    width=0.004,
+                    color=[c],
+                    zorder=self.zorder,
+                )
@@ -14,13 +14,26 @@ class Board:
     """
 
     def __init__(self, size: Tuple[float, float] = (8.0, 6.0)) -> None:
-        import matplotlib.pyplot as plt  # deferred import
-
-        self.figure, self.ax = plt.subplots(figsize=size)
+        self._size = size
+        self.figure: Any = None
+        self.ax: Any = None
         self.components: list[Any] = []
         self.beams: list[Any] = []
         self.annotations: list[Any] = []
-        self._configure_axes()
+        self._drawn = False
+
+    def _ensure_figure(self) -> None:
+        """Create the figure and axes on first render.
+
+        Building the scene graph alone should not pay for Matplotlib
+        figure setup; the figure materializes when `draw` or `save` needs
+        it.
+        """
+        if self.figure is None:
+            import matplotlib.pyplot as plt  # deferred import
+
+            self.figure, self.ax = plt.subplots(figsize=self._size)
+            self._configure_axes()
 
     def _configure_axes(self) -> None:
         self.ax.set_aspect("equal", adjustable="box")
@@ -31,6 +44,7 @@ class Board:
             self.components.append(item)
         else:
             raise TypeError("Item must implement a draw(ax) method")
+        self._drawn = False
         return item
 
     def add_many(self, items: Iterable[Any]) -> None:
@@ -41,25 +55,68 @@ class Board:
         if not hasattr(beam, "draw"):
             raise TypeError("Beam must implement a draw(ax) method")
         self.beams.append(beam)
+        self._drawn = False
         return beam
 
     def annotate(self, annotation: Any) -> Any:
         if not hasattr(annotation, "draw"):
             raise TypeError("Annotation must implement a draw(ax) method")
         self.annotations.append(annotation)
+        self._drawn = False
         return annotation
 
     def draw(self) -> tuple[Any, Any]:
-        for component in self.components:
-            component.draw(self.ax)
+        from optics_diagram import _batch
+
+        self._ensure_figure()
+        batched: list[Any] = []
+        with _batch.collect(self.ax):
+            for component in self.components:
+                if hasattr(component, "patches"):
+                    batched.extend(component.patches())
+                else:
+                    component.draw(self.ax)
+        self._add_patch_collections(batched)
         for beam in self.beams:
             beam.draw(self.ax)
         for note in self.annotations:
             note.draw(self.ax)
+        self._drawn = True
         return self.figure, self.ax
 
+    def _add_patch_collections(self, batched: list[Any]) -> None:
+        """Batch patches collected from components into PatchCollections.
+
+        Components exposing a `patches()` method return patches in data
+        coordinates; grouping them by zorder keeps stacking intact while
+        reducing the per-artist dispatch to one collection per layer.
+        """
+        from matplotlib.collections import PatchCollection
+
+        groups: dict[tuple[Any, ...], list[Any]] = {}
+        for patch in batched:
+            key = (patch.get_zorder(), patch.get_joinstyle())
+            groups.setdefault(key, []).append(patch)
+        for (zorder, joinstyle), group in groups.items():
+            collection = PatchCollection(group, match_original=True, zorder=zorder)
+            collection.set_joinstyle(joinstyle)
+            collection.set_transform(self.ax.transData)
+            self.ax.add_collection(collection)
+
     def save(
-        self, output_path: str, dpi: int = 300, bbox_inches: str = "tight"
+        self,
+        output_path: str,
+        dpi: int = 300,
+        bbox_inches: str = "tight",
+        force: bool = False,
     ) -> None:
-        self.draw()
+        """Save the board, rendering first only if it has pending changes.
+
+        Pass `force=True` to re-render even when nothing changed since the
+        last `draw()` (note that redrawing stacks a second set of artists
+        on the axes).
+        """
+        self._ensure_figure()
+        if force or not self._drawn:
+            self.draw()
         self.figure.savefig(output_path, dpi=dpi, bbox_inches=bbox_inches)
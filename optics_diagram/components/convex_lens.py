@@ -3,11 +3,30 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 from optics_diagram.beam import BeamPoint
+from optics_diagram._batch import add_patch
+import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
-from matplotlib.transforms import Affine2D
+from optics_diagram._transforms import rotation_around
 from matplotlib.path import Path
 
+# Path codes are identical for every lens instance; only vertices vary
+_CODES = np.array(
+    [
+        Path.MOVETO,
+        Path.LINETO,
+        Path.CURVE4,
+        Path.CURVE4,
+        Path.CURVE4,
+        Path.LINETO,
+        Path.CURVE4,
+        Path.CURVE4,
+        Path.CURVE4,
+        Path.CLOSEPOLY,
+    ],
+    dtype=Path.code_type,
+)
+
 
 @dataclass
 class ConvexLens:
@@ -21,56 +40,36 @@ class ConvexLens:
     linewidth: float = 2.0
     belly_factor: float = 6  # center width = thickness * belly_factor
 
-    def draw(self, ax: Any) -> None:
+    def _patch(self) -> patches.PathPatch:
+        """Build the lens patch with rotation baked into data coordinates."""
         cx, cy = self.x, self.y
         h = self.height
         t = self.thickness
 
-        tr = Affine2D().rotate_deg_around(cx, cy, self.angle_deg) + ax.transData
-
         top_y = cy + h / 2
         bot_y = cy - h / 2
         half_top = t / 2
         half_belly = (t * self.belly_factor) / 2
 
-        left_top = (cx - half_top, top_y)
-        right_top = (cx + half_top, top_y)
-        left_bottom = (cx - half_top, bot_y)
-        right_bottom = (cx + half_top, bot_y)
-
-        # Outward bulge controls
-        r_ctrl1 = (cx + half_belly, cy + h * 0.35)
-        r_ctrl2 = (cx + half_belly, cy - h * 0.35)
-        l_ctrl1 = (cx - half_belly, cy - h * 0.35)
-        l_ctrl2 = (cx - half_belly, cy + h * 0.35)
-
-        vertices = [
-            left_top,  # M
-            right_top,  # L
-            r_ctrl1,  # C c1
-            r_ctrl2,  # C c2
-            right_bottom,  # C end
-            left_bottom,  # L
-            l_ctrl1,  # C c1
-            l_ctrl2,  # C c2
-            left_top,  # C end
-            left_top,  # CLOSEPOLY anchor
-        ]
-        codes = [
-            Path.MOVETO,
-            Path.LINETO,
-            Path.CURVE4,
-            Path.CURVE4,
-            Path.CURVE4,
-            Path.LINETO,
-            Path.CURVE4,
-            Path.CURVE4,
-            Path.CURVE4,
-            Path.CLOSEPOLY,
-        ]
-
-        lens_path = Path(vertices, codes)
-        lens_patch = patches.PathPatch(
+        # Outward bulge controls sit at +-half_belly; vertices go straight
+        # into an ndarray to skip the list-of-tuples round trip
+        verts = np.empty((10, 2), dtype=np.float64)
+        verts[0] = cx - half_top, top_y  # M (left top)
+        verts[1] = cx + half_top, top_y  # L (right top)
+        verts[2] = cx + half_belly, cy + h * 0.35  # C c1
+        verts[3] = cx + half_belly, cy - h * 0.35  # C c2
+        verts[4] = cx + half_top, bot_y  # C end (right bottom)
+        verts[5] = cx - half_top, bot_y  # L (left bottom)
+        verts[6] = cx - half_belly, cy - h * 0.35  # C c1
+        verts[7] = cx - half_belly, cy + h * 0.35  # C c2
+        verts[8] = cx - half_top, top_y  # C end (left top)
+        verts[9] = cx - half_top, top_y  # CLOSEPOLY anchor
+
+        if self.angle_deg:
+            verts = rotation_around(cx, cy, self.angle_deg).transform(verts)
+
+        lens_path = Path(verts, _CODES)
+        return patches.PathPatch(
             lens_path,
             facecolor=self.facecolor,
             edgecolor=self.edgecolor,
@@ -78,8 +77,13 @@ class ConvexLens:
             alpha=0.6,
             joinstyle="round",
         )
-        lens_patch.set_transform(tr)
-        ax.add_patch(lens_patch)
+
+    def patches(self) -> list[patches.Patch]:
+        """Return this lens's patches so `Board` can batch-render them."""
+        return [self._patch()]
+
+    def draw(self, ax: Any) -> None:
+        add_patch(ax, self._patch())
 
     # Beam helpers
     def beam_contact_point(self) -> tuple[float, float]:
@@ -1,14 +1,97 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Optional
 from optics_diagram.beam import BeamPoint
+from optics_diagram._batch import add_patch
 
 import numpy as np
 import matplotlib.patches as patches
 import matplotlib.pyplot as plt
 from matplotlib.colors import LinearSegmentedColormap
-from matplotlib.transforms import Affine2D
+from optics_diagram._transforms import rotation_around
+
+try:  # Numba is optional; the face raster compiles to one fused kernel if present
+    from numba import njit
+except ImportError:  # pragma: no cover
+    njit = None
+
+# Stronger green tint for clearer distinction from regular mirrors
+_DICHROIC_COLORS = ["#2fab3a", "#d9ffd0", "#2fab3a"]
+_DICHROIC_CMAP = LinearSegmentedColormap.from_list("dichroic_green", _DICHROIC_COLORS)
+
+
+def _dichroic_rgba_fused(rows: int, cols: int, sigma: float) -> np.ndarray:
+    # Single pass over the output: colormap sampling (analytic lerp over
+    # the symmetric green/white/green stops), Gaussian highlight, and the
+    # alpha blend all happen per pixel with no intermediate arrays.
+    # Mirrors the NumPy fallback below up to colormap LUT quantization.
+    edge_r, edge_g, edge_b = 0x2F / 255.0, 0xAB / 255.0, 0x3A / 255.0
+    mid_r, mid_g, mid_b = 0xD9 / 255.0, 0xFF / 255.0, 0xD0 / 255.0
+    hi_r, hi_g, hi_b = 0.85, 1.00, 0.85
+    a_min = np.exp(-0.5 / (sigma * sigma))
+    a_scale = 0.25 / (1.0 - a_min + 1e-9)
+    rgba = np.empty((rows, cols, 4), dtype=np.float32)
+    for j in range(cols):
+        x = 2.0 * j / (cols - 1) - 1.0
+        t = 1.0 - abs(x)  # 0 at the edges, 1 at the white center
+        a = (np.exp(-0.5 * (x / sigma) ** 2) - a_min) * a_scale
+        r = (edge_r + (mid_r - edge_r) * t) * (1.0 - a) + hi_r * a
+        g = (edge_g + (mid_g - edge_g) * t) * (1.0 - a) + hi_g * a
+        b = (edge_b + (mid_b - edge_b) * t) * (1.0 - a) + hi_b * a
+        for i in range(rows):
+            rgba[i, j, 0] = r
+            rgba[i, j, 1] = g
+            rgba[i, j, 2] = b
+            rgba[i, j, 3] = 1.0
+    return rgba
+
+
+if njit is not None:
+    _dichroic_rgba_fused = njit(cache=True)(_dichroic_rgba_fused)
+
+
+@lru_cache(maxsize=16)
+def _dichroic_rgba(rows: int, cols: int) -> np.ndarray:
+    """Return a cached (rows, cols, 4) RGBA image of the mirror face.
+
+    The green gradient and the central coating highlight are composited
+    here once, so a single imshow replaces the former gradient +
+    highlight artist pair. With Numba installed the whole raster is
+    produced by one fused kernel; otherwise a NumPy expression pipeline
+    builds it. The result depends only on the raster shape, so repeat
+    draws of any number of dichroic mirrors reuse the same buffer.
+    """
+    sigma = 0.27
+    if njit is not None:
+        return _dichroic_rgba_fused(rows, cols, sigma)
+
+    # Vertical gradient: green edges to white center to green
+    grad_line = np.linspace(0.0, 1.0, cols, dtype=np.float32)
+
+    # Gaussian highlight profile across the width
+    x = np.linspace(-1.0, 1.0, cols, dtype=np.float32)
+    alpha_profile = np.exp(-0.5 * (x / sigma) ** 2)
+    alpha_profile = (alpha_profile - alpha_profile.min()) / (
+        alpha_profile.max() - alpha_profile.min() + 1e-9
+    )
+    alpha_profile *= 0.25
+
+    # Light-green highlight instead of pure white to keep the green feel
+    green_rgb = np.array([0.85, 1.00, 0.85], dtype=np.float32)
+
+    # Alpha-composite the highlight over the colormapped gradient
+    base = _DICHROIC_CMAP(grad_line)[:, :3].astype(np.float32)
+    a = alpha_profile[:, None]
+    line_rgb = base * (1.0 - a) + green_rgb * a
+
+    # float32 end to end: imshow casts to float32 internally, so wider
+    # buffers on this path are pure memory traffic
+    rgba = np.empty((rows, cols, 4), dtype=np.float32)
+    rgba[..., :3] = line_rgb[None, :, :]
+    rgba[..., 3] = 1.0
+    return rgba
 
 
 @dataclass
@@ -29,24 +112,17 @@ class DichroicMirror:
         h = self.length if self.length is not None else self.height
         t = self.thickness
 
-        tr = Affine2D().rotate_deg_around(cx, cy, self.angle_deg) + ax.transData
+        tr = rotation_around(cx, cy, self.angle_deg) + ax.transData
 
         # Mirror face rectangle (green dichroic look)
         inner_w, inner_h = t, h
 
-        # Vertical gradient: green edges to white center to green
         gradient_cols = 256
         gradient_rows = max(256, int(gradient_cols * inner_h / max(inner_w, 1e-6)))
-        grad_line = np.linspace(0.0, 1.0, gradient_cols, dtype=float)
-        gradient = np.tile(grad_line, (gradient_rows, 1))
-        # Stronger green tint for clearer distinction from regular mirrors
-        cmap = LinearSegmentedColormap.from_list(
-            "dichroic_green",
-            ["#2fab3a", "#d9ffd0", "#2fab3a"],
-        )
 
+        # Gradient with the coating highlight pre-composited (one artist)
         img = ax.imshow(
-            gradient,
+            _dichroic_rgba(gradient_rows, gradient_cols),
             extent=[
                 cx - inner_w / 2,
                 cx + inner_w / 2,
@@ -54,44 +130,11 @@ class DichroicMirror:
                 cy + inner_h / 2,
             ],
             origin="lower",
-            cmap=cmap,
-            interpolation="bicubic",
-            alpha=1.0,
+            interpolation="bilinear",
             zorder=3,
         )
         img.set_transform(tr)
 
-        # Lightweight highlight in the center to emphasize coating
-        cols = gradient_cols
-        rows = gradient_rows
-        x = np.linspace(-1.0, 1.0, cols)
-        sigma = 0.27
-        alpha_profile = np.exp(-0.5 * (x / sigma) ** 2)
-        alpha_profile = (alpha_profile - alpha_profile.min()) / (
-            alpha_profile.max() - alpha_profile.min() + 1e-9
-        )
-        alpha_profile *= 0.25
-        highlight_alpha = np.tile(alpha_profile, (rows, 1))
-        # Light-green highlight instead of pure white to keep the green feel
-        green_img = np.ones((rows, cols, 3), dtype=float)
-        green_img[..., 0] *= 0.85
-        green_img[..., 1] *= 1.00
-        green_img[..., 2] *= 0.85
-        hi = ax.imshow(
-            green_img,
-            extent=[
-                cx - inner_w / 2,
-                cx + inner_w / 2,
-                cy - inner_h / 2,
-                cy + inner_h / 2,
-            ],
-            origin="lower",
-            interpolation="bicubic",
-            alpha=highlight_alpha,
-            zorder=4,
-        )
-        hi.set_transform(tr)
-
         # Thin black stroke around the mirror face
         face_border = patches.Rectangle(
             (cx - inner_w / 2, cy - inner_h / 2),
@@ -103,7 +146,7 @@ class DichroicMirror:
             zorder=5,
         )
         face_border.set_transform(tr)
-        ax.add_patch(face_border)
+        add_patch(ax, face_border)
 
         # Solid black rectangle on the right side (bar), SVG proportion
         right_bar_w = inner_w * self.right_bar_fraction
@@ -117,7 +160,7 @@ class DichroicMirror:
             zorder=6,
         )
         right_bar.set_transform(tr)
-        ax.add_patch(right_bar)
+        add_patch(ax, right_bar)
 
     # Beam helpers
     def beam_contact_point(self) -> tuple[float, float]:
@@ -1,14 +1,40 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 from matplotlib.colors import LinearSegmentedColormap
-from matplotlib.transforms import Affine2D
+from optics_diagram._transforms import rotate_points, rotation_around
 from optics_diagram.beam import BeamPoint
-from math import cos, sin, radians
+from optics_diagram._batch import add_patch
+
+_EOM_CMAP = LinearSegmentedColormap.from_list(
+    "eom_body",
+    [
+        "#ffffff",
+        "#ffff99",
+        "#ffff58",
+        "#ffff3e",
+        "#ffff58",
+        "#ffffe0",
+        "#ffffff",
+    ],
+)
+
+
+@lru_cache(maxsize=16)
+def _eom_gradient(rows: int, cols: int) -> np.ndarray:
+    """Return the cached vertical body gradient as a (rows, cols) view.
+
+    Only a (rows, 1) float32 column is materialized; broadcasting expands
+    it to the full shape without allocating rows*cols values, and the
+    result is reused across draws with the same raster shape.
+    """
+    grad_line = np.linspace(0.0, 1.0, rows, dtype=np.float32)[:, None]
+    return np.broadcast_to(grad_line, (rows, cols))
 
 
 @dataclass
@@ -24,7 +50,7 @@ class EOM:
     def draw(self, ax: Any) -> None:
         cx, cy = self.x, self.y
         w, h = self.width, self.height
-        tr = Affine2D().rotate_deg_around(cx, cy, self.angle_deg) + ax.transData
+        tr = rotation_around(cx, cy, self.angle_deg) + ax.transData
 
         # Top and bottom brown caps
         cap_h = h * 0.24
@@ -39,7 +65,7 @@ class EOM:
                 zorder=4,
             )
             cap.set_transform(tr)
-            ax.add_patch(cap)
+            add_patch(ax, cap)
 
         # Middle yellow-ish gradient body
         body_h = h - 2 * cap_h
@@ -53,34 +79,20 @@ class EOM:
             zorder=3,
         )
         body.set_transform(tr)
-        ax.add_patch(body)
+        add_patch(ax, body)
 
         cols = 256
         rows = max(128, int(cols * body_h / max(w, 1e-6)))
-        grad_line = np.linspace(0.0, 1.0, rows)
-        gradient = np.tile(grad_line[:, None], (1, cols))
-        cmap = LinearSegmentedColormap.from_list(
-            "eom_body",
-            [
-                "#ffffff",
-                "#ffff99",
-                "#ffff58",
-                "#ffff3e",
-                "#ffff58",
-                "#ffffe0",
-                "#ffffff",
-            ],
-        )
+        gradient = _eom_gradient(rows, cols)
         img = ax.imshow(
             gradient,
             extent=[cx - w / 2, cx + w / 2, cy - body_h / 2, cy + body_h / 2],
             origin="lower",
-            cmap=cmap,
-            interpolation="bicubic",
+            cmap=_EOM_CMAP,
+            interpolation="bilinear",
             zorder=2,
         )
         img.set_transform(tr)
-        img.set_clip_path(body)
 
     # Beam helpers (anchor center)
     def beam_contact_point(self) -> tuple[float, float]:
@@ -93,23 +105,21 @@ class EOM:
         return self
 
     # RF contact points (centers of the top and bottom caps in world coords)
-    def _rotate_local(self, lx: float, ly: float) -> tuple[float, float]:
-        a = radians(self.angle_deg)
-        rx = lx * cos(a) - ly * sin(a)
-        ry = lx * sin(a) + ly * cos(a)
-        return self.x + rx, self.y + ry
-
-    def rf_contact_top(self) -> tuple[float, float]:
+    def rf_contact_points(self) -> tuple[tuple[float, float], tuple[float, float]]:
+        """Return (top, bottom) RF contacts, rotated in one matmul."""
         h = self.height
         cap_h = h * 0.24
         y_local = (h / 2.0) - (cap_h / 2.0)
-        return self._rotate_local(0.0, y_local)
+        pts = rotate_points(
+            [(0.0, y_local), (0.0, -y_local)], self.angle_deg, (self.x, self.y)
+        )
+        return (pts[0, 0], pts[0, 1]), (pts[1, 0], pts[1, 1])
+
+    def rf_contact_top(self) -> tuple[float, float]:
+        return self.rf_contact_points()[0]
 
     def rf_contact_bottom(self) -> tuple[float, float]:
-        h = self.height
-        cap_h = h * 0.24
-        y_local = -((h / 2.0) - (cap_h / 2.0))
-        return self._rotate_local(0.0, y_local)
+        return self.rf_contact_points()[1]
 
     def rf_contact_point(self) -> tuple[float, float]:
         """Primary RF contact (top)."""
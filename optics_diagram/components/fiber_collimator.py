@@ -5,11 +5,26 @@ from typing import Any
 
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
-import numpy as np
 from matplotlib.colors import LinearSegmentedColormap
-from matplotlib.transforms import Affine2D
 from optics_diagram.beam import BeamPoint
-from math import cos, sin, radians
+from optics_diagram._batch import add_patch
+from optics_diagram._transforms import cos_sin_deg, rotation_around
+from optics_diagram._shading import _rgba_fill
+
+
+_METAL_CMAP_TALL = LinearSegmentedColormap.from_list(
+    "metal_tall",
+    [
+        "#ffffff",
+        "#c4c4c4",
+        "#5c5c5c",
+        "#1a1a1a",
+        "#000000",
+        "#4c4c4c",
+        "#a2a2a2",
+        "#ffffff",
+    ],
+)
 
 
 @dataclass
@@ -25,7 +40,7 @@ class FiberCollimator:
     def draw(self, ax: Any) -> None:
         cx, cy = self.x, self.y
         w, h = self.width, self.height
-        tr = Affine2D().rotate_deg_around(cx, cy, self.angle_deg) + ax.transData
+        tr = rotation_around(cx, cy, self.angle_deg) + ax.transData
 
         # Map proportions from the SVG: total width 23.428, block width 5.668
         total_w_ref = 23.427979
@@ -41,10 +56,10 @@ class FiberCollimator:
             cmap: LinearSegmentedColormap,
             z: int,
         ) -> None:
-            rows = max(128, int(256 * rh / max(rw, 1e-6)))
-            cols = 256
-            gy = np.linspace(0.0, 1.0, rows)
-            gradient = np.tile(gy[:, None], (1, cols))
+            # The ramp only varies down the rows; 2 columns are enough,
+            # bicubic interpolation upsamples the transverse direction
+            rows = 256
+            cols = 2
             rect = patches.Rectangle(
                 (x0, y0),
                 rw,
@@ -55,45 +70,29 @@ class FiberCollimator:
                 zorder=z,
             )
             rect.set_transform(tr)
-            ax.add_patch(rect)
+            add_patch(ax, rect)
             img = ax.imshow(
-                gradient,
+                _rgba_fill(cmap, rows, cols, "v"),
                 extent=[x0, x0 + rw, y0, y0 + rh],
                 origin="lower",
-                cmap=cmap,
-                interpolation="bicubic",
+                interpolation="bilinear",
                 zorder=z - 1,
             )
             img.set_transform(tr)
-            img.set_clip_path(rect)
-
-        metal_cmap_tall = LinearSegmentedColormap.from_list(
-            "metal_tall",
-            [
-                "#ffffff",
-                "#c4c4c4",
-                "#5c5c5c",
-                "#1a1a1a",
-                "#000000",
-                "#4c4c4c",
-                "#a2a2a2",
-                "#ffffff",
-            ],
-        )
 
         # Left rectangle (wider and longer)
         gap = 0.0  # ensure no gaps between rectangles
         left_w = block_w * 1.20
         left_h = h * 1.30
         left_x = cx - w / 2
-        draw_grad_rect(left_x, cy - left_h / 2, left_w, left_h, metal_cmap_tall, z=5)
+        draw_grad_rect(left_x, cy - left_h / 2, left_w, left_h, _METAL_CMAP_TALL, z=5)
 
         # Center rectangle (slightly wider than left, and 1.3x longer than left)
         center_w = left_w * 1.50
         center_h = h * 1.10
         center_x = left_x + left_w + gap
         draw_grad_rect(
-            center_x, cy - center_h / 2, center_w, center_h, metal_cmap_tall, z=5
+            center_x, cy - center_h / 2, center_w, center_h, _METAL_CMAP_TALL, z=5
         )
 
         # Right rectangle (bit shorter)
@@ -101,16 +100,16 @@ class FiberCollimator:
         right_h = h * 0.25
         right_x = center_x + center_w + gap
         draw_grad_rect(
-            right_x, cy - right_h / 2, right_w, right_h, metal_cmap_tall, z=6
+            right_x, cy - right_h / 2, right_w, right_h, _METAL_CMAP_TALL, z=6
         )
 
         # Remaining body intentionally left blank per request (no blue slats)
 
     # Contacts: left = beam (free-space), right = fiber
     def _rotate_local(self, lx: float, ly: float) -> tuple[float, float]:
-        a = radians(self.angle_deg)
-        rx = lx * cos(a) - ly * sin(a)
-        ry = lx * sin(a) + ly * cos(a)
+        ca, sa = cos_sin_deg(self.angle_deg)
+        rx = lx * ca - ly * sa
+        ry = lx * sa + ly * ca
         return self.x + rx, self.y + ry
 
     def beam_contact_point(self) -> tuple[float, float]:
@@ -4,6 +4,8 @@ from dataclasses import dataclass
 from typing import Any
 import matplotlib.patches as patches
 
+from optics_diagram._batch import add_patch
+
 
 @dataclass
 class FiberDichroic:
@@ -21,7 +23,7 @@ class FiberDichroic:
             edgecolor="#b2641a",
             facecolor="#f8e7d6",
         )
-        ax.add_patch(rect)
+        add_patch(ax, rect)
         ax.text(self.x, self.y, "FD", ha="center", va="center")
 
 
@@ -1,14 +1,55 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Optional
 from optics_diagram.beam import BeamPoint
+from optics_diagram._batch import add_patch
+from optics_diagram._transforms import cos_sin_deg, rotation_around
 
 import numpy as np
 import matplotlib.patches as patches
 from matplotlib.colors import LinearSegmentedColormap
-from matplotlib.transforms import Affine2D
-from math import cos, sin, radians
+
+
+_MIRROR_CMAP = LinearSegmentedColormap.from_list(
+    "mirror_reflection",
+    ["#3f5864", "#f5fbff", "#3f5864"],
+)
+
+
+@lru_cache(maxsize=8)
+def _mirror_rgba(rows: int, cols: int) -> np.ndarray:
+    """Return a cached (rows, cols, 4) RGBA image of the mirror face.
+
+    The reflective gradient and the narrow white specular highlight are
+    composited here once, so a single imshow replaces the former
+    gradient + highlight artist pair. The result depends only on the
+    raster shape, so every mirror in a diagram reuses the same buffer.
+    """
+    # Dark blue-gray edges -> very light center for strong specular feel
+    grad_line = np.linspace(0.0, 1.0, cols, dtype=np.float32)
+
+    # Gaussian-shaped highlight alpha across the width
+    x = np.linspace(-1.0, 1.0, cols, dtype=np.float32)
+    sigma = 0.22  # narrower highlight
+    alpha_profile = np.exp(-0.5 * (x / sigma) ** 2)
+    alpha_profile = (alpha_profile - alpha_profile.min()) / (
+        alpha_profile.max() - alpha_profile.min() + 1e-9
+    )
+    alpha_profile *= 0.55
+
+    # Alpha-composite the white highlight over the colormapped gradient
+    base = _MIRROR_CMAP(grad_line)[:, :3].astype(np.float32)
+    a = alpha_profile[:, None]
+    line_rgb = base * (1.0 - a) + a
+
+    # uint8 RGBA takes Agg's fast path: no float conversion at render
+    # time and a quarter of the float64 footprint
+    rgba = np.empty((rows, cols, 4), dtype=np.uint8)
+    rgba[..., :3] = (line_rgb[None, :, :] * 255.0 + 0.5).astype(np.uint8)
+    rgba[..., 3] = 255
+    return rgba
 
 
 @dataclass
@@ -35,25 +76,21 @@ class FlatMirror:
         t = self.thickness
 
         # Rotation around the mirror center
-        tr = Affine2D().rotate_deg_around(cx, cy, self.angle_deg) + ax.transData
+        tr = rotation_around(cx, cy, self.angle_deg) + ax.transData
 
         # Mirror face rectangle (left area in the SVG)
         inner_w, inner_h = t, h
 
         # Create a subtle reflective gradient for the mirror face
         # Dark edges -> bright center -> dark edges
+        # The face only varies across the columns; 2 rows are enough,
+        # bicubic interpolation upsamples the transverse direction
         gradient_cols = 256
-        gradient_rows = max(256, int(gradient_cols * inner_h / max(inner_w, 1e-6)))
-        grad_line = np.linspace(0.0, 1.0, gradient_cols, dtype=float)
-        gradient = np.tile(grad_line, (gradient_rows, 1))
-        # Dark blue-gray edges -> very light center for strong specular feel
-        cmap = LinearSegmentedColormap.from_list(
-            "mirror_reflection",
-            ["#3f5864", "#f5fbff", "#3f5864"],
-        )
+        gradient_rows = 2
 
+        # Gradient with the specular highlight pre-composited (one artist)
         img = ax.imshow(
-            gradient,
+            _mirror_rgba(gradient_rows, gradient_cols),
             extent=[
                 cx - inner_w / 2,
                 cx + inner_w / 2,
@@ -61,41 +98,11 @@ class FlatMirror:
                 cy + inner_h / 2,
             ],
             origin="lower",
-            cmap=cmap,
-            interpolation="bicubic",
-            alpha=1.0,
+            interpolation="bilinear",
             zorder=3,
         )
         img.set_transform(tr)
 
-        # Add a narrow white specular highlight using per-pixel alpha
-        # Construct a Gaussian-shaped alpha across width
-        cols = gradient_cols
-        rows = gradient_rows
-        x = np.linspace(-1.0, 1.0, cols)
-        sigma = 0.22  # narrower highlight
-        alpha_profile = np.exp(-0.5 * (x / sigma) ** 2)
-        alpha_profile = (alpha_profile - alpha_profile.min()) / (
-            alpha_profile.max() - alpha_profile.min() + 1e-9
-        )
-        alpha_profile *= 0.55
-        highlight_alpha = np.tile(alpha_profile, (rows, 1))
-        white_img = np.ones((rows, cols, 3), dtype=float)
-        hi = ax.imshow(
-            white_img,
-            extent=[
-                cx - inner_w / 2,
-                cx + inner_w / 2,
-                cy - inner_h / 2,
-                cy + inner_h / 2,
-            ],
-            origin="lower",
-            interpolation="bicubic",
-            alpha=highlight_alpha,
-            zorder=4,
-        )
-        hi.set_transform(tr)
-
         # Thin black stroke around the mirror face
         face_border = patches.Rectangle(
             (cx - inner_w / 2, cy - inner_h / 2),
@@ -107,7 +114,7 @@ class FlatMirror:
             zorder=5,
         )
         face_border.set_transform(tr)
-        ax.add_patch(face_border)
+        add_patch(ax, face_border)
 
         # Solid black rectangle on the right side, aligned to the mirror edge
         right_bar_w = inner_w * self.right_bar_fraction
@@ -121,7 +128,7 @@ class FlatMirror:
             zorder=6,
         )
         right_bar.set_transform(tr)
-        ax.add_patch(right_bar)
+        add_patch(ax, right_bar)
 
     # Beam helpers
     def _anchor_local(self) -> tuple[float, float]:
@@ -137,9 +144,9 @@ class FlatMirror:
     def beam_contact_point(self) -> tuple[float, float]:
         """Return the world-space anchor point on the mirror plane."""
         ax_local, ay_local = self._anchor_local()
-        a = radians(self.angle_deg)
-        dx = ax_local * cos(a) - ay_local * sin(a)
-        dy = ax_local * sin(a) + ay_local * cos(a)
+        ca, sa = cos_sin_deg(self.angle_deg)
+        dx = ax_local * ca - ay_local * sa
+        dy = ax_local * sa + ay_local * ca
         return self.x + dx, self.y + dy
 
     def to_beam_point(self, point: BeamPoint) -> "FlatMirror":
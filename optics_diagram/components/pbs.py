@@ -3,11 +3,18 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 from optics_diagram.beam import BeamPoint
-import numpy as np
+from optics_diagram._batch import add_line, add_patch
+from optics_diagram._transforms import rotation_around
+from optics_diagram._shading import _rgba_fill
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
+from matplotlib.lines import Line2D
 from matplotlib.colors import LinearSegmentedColormap
-from matplotlib.transforms import Affine2D
+
+
+_PBS_CMAP = LinearSegmentedColormap.from_list(
+    "npbs_fill", ["#ffffff", "#89A4B6"], N=256
+)
 
 
 @dataclass
@@ -22,7 +29,7 @@ class PBS:
     def draw(self, ax: Any) -> None:
         cx, cy = self.x, self.y
         s = self.size
-        tr = Affine2D().rotate_deg_around(cx, cy, self.angle_deg) + ax.transData
+        tr = rotation_around(cx, cy, self.angle_deg) + ax.transData
 
         # Outline square (no facecolor; we'll paint a clipped gradient under it)
         square = patches.Rectangle(
@@ -35,30 +42,23 @@ class PBS:
             zorder=5,
         )
         square.set_transform(tr)
-        ax.add_patch(square)
+        add_patch(ax, square)
 
         # Diagonal gradient (top-left white -> bottom-right blue-gray)
-        rows = cols = 256
-        gx = np.linspace(0.0, 1.0, cols)
-        gy = np.linspace(0.0, 1.0, rows)
-        xv, yv = np.meshgrid(gx, gy)
-        diag = (xv + (1 - yv)) / 2.0  # TL to BR ramp
-        cmap = LinearSegmentedColormap.from_list(
-            "npbs_fill", ["#ffffff", "#89A4B6"], N=256
-        )
+        # A 32x32 source is plenty for a linear ramp; bicubic upsamples it
+        rows = cols = 32
         img = ax.imshow(
-            diag,
+            _rgba_fill(_PBS_CMAP, rows, cols, "diag"),
             extent=[cx - s / 2, cx + s / 2, cy - s / 2, cy + s / 2],
             origin="lower",
-            cmap=cmap,
             interpolation="bicubic",
             zorder=3,
         )
         img.set_transform(tr)
-        img.set_clip_path(square)
 
-        # Diagonal line from top-left to bottom-right
-        (line,) = ax.plot(
+        # Diagonal line from top-left to bottom-right; added as a bare
+        # Line2D to skip ax.plot's autoscale and label bookkeeping
+        line = Line2D(
             [cx - s / 2, cx + s / 2],
             [cy + s / 2, cy - s / 2],
             color=self.edgecolor,
@@ -66,6 +66,7 @@ class PBS:
             zorder=4,
         )
         line.set_transform(tr)
+        add_line(ax, line)
 
     # Beam helpers (anchor at component center)
     def beam_contact_point(self) -> tuple[float, float]:
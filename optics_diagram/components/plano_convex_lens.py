@@ -3,11 +3,28 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 from optics_diagram.beam import BeamPoint
+from optics_diagram._batch import add_patch
+from optics_diagram._transforms import rotation_around
+import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
-from matplotlib.transforms import Affine2D
 from matplotlib.path import Path
 
+# Path codes are identical for every lens instance; only vertices vary
+_CODES = np.array(
+    [
+        Path.MOVETO,
+        Path.LINETO,
+        Path.CURVE4,
+        Path.CURVE4,
+        Path.CURVE4,
+        Path.LINETO,
+        Path.LINETO,
+        Path.CLOSEPOLY,
+    ],
+    dtype=Path.code_type,
+)
+
 
 @dataclass
 class PlanoConvexLens:
@@ -21,51 +38,35 @@ class PlanoConvexLens:
     linewidth: float = 1.0
     belly_factor: float = 12  # center width on convex side relative to thickness
 
-    def draw(self, ax: Any) -> None:
+    def _patch(self) -> patches.PathPatch:
+        """Build the lens patch with rotation baked into data coordinates."""
         cx, cy = self.x, self.y
         h = self.height
         t = self.thickness
 
-        tr = Affine2D().rotate_deg_around(cx, cy, self.angle_deg) + ax.transData
-
         top_y = cy + h / 2
         bot_y = cy - h / 2
         half_top = t / 2
         half_belly = (t * self.belly_factor) / 2
 
-        # Always flat on the left; users can rotate 180° if needed
-        left_top = (cx - half_top, top_y)
-        right_top = (cx + half_top, top_y)
-        left_bottom = (cx - half_top, bot_y)
-        right_bottom = (cx + half_top, bot_y)
-
-        # Convex bulge on the right side
-        c1 = (cx + half_belly, cy + h * 0.35)
-        c2 = (cx + half_belly, cy - h * 0.35)
-
-        vertices = [
-            left_top,  # M (flat side top)
-            right_top,  # L (top edge)
-            c1,  # C control 1 (convex)
-            c2,  # C control 2 (convex)
-            right_bottom,  # C end at bottom-right
-            left_bottom,  # L bottom edge back to flat side
-            left_top,  # L up the flat side
-            left_top,  # CLOSEPOLY anchor
-        ]
-        codes = [
-            Path.MOVETO,
-            Path.LINETO,
-            Path.CURVE4,
-            Path.CURVE4,
-            Path.CURVE4,
-            Path.LINETO,
-            Path.LINETO,
-            Path.CLOSEPOLY,
-        ]
-
-        lens_path = Path(vertices, codes)
-        lens_patch = patches.PathPatch(
+        # Always flat on the left; users can rotate 180° if needed.
+        # Vertices go straight into an ndarray to skip the
+        # list-of-tuples round trip
+        verts = np.empty((8, 2), dtype=np.float64)
+        verts[0] = cx - half_top, top_y  # M (flat side top)
+        verts[1] = cx + half_top, top_y  # L (top edge)
+        verts[2] = cx + half_belly, cy + h * 0.35  # C control 1 (convex)
+        verts[3] = cx + half_belly, cy - h * 0.35  # C control 2 (convex)
+        verts[4] = cx + half_top, bot_y  # C end at bottom-right
+        verts[5] = cx - half_top, bot_y  # L bottom edge back to flat side
+        verts[6] = cx - half_top, top_y  # L up the flat side
+        verts[7] = cx - half_top, top_y  # CLOSEPOLY anchor
+
+        if self.angle_deg:
+            verts = rotation_around(cx, cy, self.angle_deg).transform(verts)
+
+        lens_path = Path(verts, _CODES)
+        return patches.PathPatch(
             lens_path,
             facecolor=self.facecolor,
             edgecolor=self.edgecolor,
@@ -73,8 +74,13 @@ class PlanoConvexLens:
             alpha=0.6,
             joinstyle="round",
         )
-        lens_patch.set_transform(tr)
-        ax.add_patch(lens_patch)
+
+    def patches(self) -> list[patches.Patch]:
+        """Return this lens's patches so `Board` can batch-render them."""
+        return [self._patch()]
+
+    def draw(self, ax: Any) -> None:
+        add_patch(ax, self._patch())
 
     # Beam helpers
     def beam_contact_point(self) -> tuple[float, float]:
@@ -3,12 +3,18 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 
-import numpy as np
 import matplotlib.patches as patches
 from matplotlib.colors import LinearSegmentedColormap
-from matplotlib.transforms import Affine2D
 
 from optics_diagram.beam import BeamPoint
+from optics_diagram._batch import add_patch
+from optics_diagram._transforms import rotation_around
+from optics_diagram._shading import _rgba_fill
+
+
+_QWP_CMAP = LinearSegmentedColormap.from_list(
+    "qwp_fill", ["#2fab3a", "#e7ffdc", "#2fab3a"], N=256
+)
 
 
 @dataclass
@@ -26,7 +32,7 @@ class QWP:
         h = self.height
         t = self.thickness
 
-        tr = Affine2D().rotate_deg_around(cx, cy, self.angle_deg) + ax.transData
+        tr = rotation_around(cx, cy, self.angle_deg) + ax.transData
 
         border = patches.Rectangle(
             (cx - t / 2, cy - h / 2),
@@ -38,26 +44,21 @@ class QWP:
             zorder=3,
         )
         border.set_transform(tr)
-        ax.add_patch(border)
+        add_patch(ax, border)
 
-        rows = max(256, int(256 * h / max(t, 1e-6)))
+        # The ramp only varies across the columns; 2 rows are enough,
+        # bicubic interpolation upsamples the transverse direction
+        rows = 2
         cols = 256
-        grad_line = np.linspace(0.0, 1.0, cols)
-        gradient = np.tile(grad_line, (rows, 1))
         # Strong green to indicate quarter-wave plate
-        cmap = LinearSegmentedColormap.from_list(
-            "qwp_fill", ["#2fab3a", "#e7ffdc", "#2fab3a"], N=256
-        )
         img = ax.imshow(
-            gradient,
+            _rgba_fill(_QWP_CMAP, rows, cols),
             extent=[cx - t / 2, cx + t / 2, cy - h / 2, cy + h / 2],
             origin="lower",
-            cmap=cmap,
-            interpolation="bicubic",
+            interpolation="bilinear",
             zorder=2,
         )
         img.set_transform(tr)
-        img.set_clip_path(border)
 
     # Beam helpers (anchor center)
     def beam_contact_point(self) -> tuple[float, float]:
@@ -1,52 +1,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, List, Sequence, Tuple
+from typing import Any, List, Tuple
 
-import numpy as np
+from optics_diagram._geom import _fillet_polyline
 
 
 Point = Tuple[float, float]
 
 
-def _normalize(vec: np.ndarray) -> np.ndarray:
-    n = np.linalg.norm(vec)
-    if n == 0:
-        return vec
-    return vec / n
-
-
-def _fillet_polyline(
-    points: Sequence[Point], radius: float = 0.5, samples: int = 6
-) -> np.ndarray:
-    if len(points) < 3:
-        return np.asarray(points, dtype=float)
-    pts = np.asarray(points, dtype=float)
-    out: List[np.ndarray] = [pts[0]]
-    for i in range(1, len(pts) - 1):
-        p_prev, p_curr, p_next = pts[i - 1], pts[i], pts[i + 1]
-        v_in = p_curr - p_prev
-        v_out = p_next - p_curr
-        len_in = np.linalg.norm(v_in)
-        len_out = np.linalg.norm(v_out)
-        if len_in == 0 or len_out == 0:
-            out.append(p_curr)
-            continue
-        u_in = _normalize(v_in)
-        u_out = _normalize(v_out)
-        cut = min(radius, 0.5 * len_in, 0.5 * len_out)
-        a = p_curr - u_in * cut
-        b = p_curr + u_out * cut
-        if np.linalg.norm(out[-1] - a) > 1e-9:
-            out.append(a)
-        for t in np.linspace(0.0, 1.0, samples, endpoint=False)[1:]:
-            pt = (1 - t) ** 2 * a + 2 * (1 - t) * t * p_curr + t**2 * b
-            out.append(pt)
-        out.append(b)
-    out.append(pts[-1])
-    return np.vstack(out)
-
-
 @dataclass
 class Fiber:
     start: Point
@@ -58,9 +20,12 @@ class Fiber:
     linestyle: str = "-"
     zorder: float = 0.5
     capstyle: str = "projecting"
+    _smooth_key: Any = field(default=None, init=False, repr=False, compare=False)
+    _smooth: Any = field(default=None, init=False, repr=False, compare=False)
 
     def add_pin(self, x: float, y: float) -> "Fiber":
         self.pins.append((x, y))
+        self._smooth_key = None
         return self
 
     def path_points(self) -> List[Point]:
@@ -70,7 +35,15 @@ class Fiber:
         waypoints = self.path_points()
         if len(waypoints) < 2:
             return
-        smooth = _fillet_polyline(waypoints, radius=self.fillet_radius, samples=6)
+        # Reuse the smoothed polyline across redraws while the route is
+        # unchanged; the key guards against in-place pin edits too
+        key = (self.start, tuple(self.pins), self.end, self.fillet_radius)
+        if key != self._smooth_key:
+            self._smooth = _fillet_polyline(
+                waypoints, radius=self.fillet_radius, samples=6
+            )
+            self._smooth_key = key
+        smooth = self._smooth
         # Offset slightly below the nominal y to route under components
         y_offset = -0.002  # small downward offset
         ys = smooth[:, 1] + y_offset